@@ -1,4 +1,10 @@
-class Aquatic:
+# Shared base so Penguin can inherit from both without a slot layout conflict
+class Animal:
+  __slots__ = ('name',)
+
+class Aquatic(Animal):
+  __slots__ = ()
+
   def __init__(self, name):
     self.name = name
 
@@ -8,7 +14,9 @@ class Aquatic:
   def greet(self):
     return f"I'm {self.name} of the sea!"
 
-class Ambulatory:
+class Ambulatory(Animal):
+  __slots__ = ()
+
   def __init__(self, name):
     self.name = name
 
@@ -19,18 +27,20 @@ class Ambulatory:
     return f"I'm {self.name} of the land!"
 
 class Penguin(Ambulatory, Aquatic):
+  __slots__ = ()
+
   def __init__(self, name):
-    Ambulatory.__init__(self, name = name)
-    Aquatic.__init__(self, name = name)
+    self.name = name
 
-# jaws = Aquatic('Jaws')
-# lassie = Ambulatory('Lassie')
-captain_cook = Penguin('Captain Cook')
+if __name__ == "__main__":
+  # jaws = Aquatic('Jaws')
+  # lassie = Ambulatory('Lassie')
+  captain_cook = Penguin('Captain Cook')
 
-# print(captain_cook.swim())
-# print(captain_cook.walk())
-# print(captain_cook.greet())
+  # print(captain_cook.swim())
+  # print(captain_cook.walk())
+  # print(captain_cook.greet())
 
-# print(f"captain_cook is instance of Penguin: {isinstance(captain_cook, Penguin)}")
-# print(f"captain_cook is instance of Aquatic: {isinstance(captain_cook, Aquatic)}")
-# print(f"captain_cook is instance of Ambulatory: {isinstance(captain_cook, Ambulatory)}")
\ No newline at end of file
+  # print(f"captain_cook is instance of Penguin: {isinstance(captain_cook, Penguin)}")
+  # print(f"captain_cook is instance of Aquatic: {isinstance(captain_cook, Aquatic)}")
+  # print(f"captain_cook is instance of Ambulatory: {isinstance(captain_cook, Ambulatory)}")
@@ -1,20 +1,25 @@
+from dataclasses import dataclass
 from random import shuffle
 
 # Each instance of Card  should have a suit ("Hearts", "Diamonds", "Clubs", or "Spades").
 # Each instance of Card  should have a value ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K").
 # Card 's __repr__  method should return the card's value and suit (e.g. "A of Clubs", "J of Diamonds", etc.)
 
+@dataclass(frozen=True, slots=True)
 class Card:
-  def __init__(self, value, suit):
-    self.value = value
-    self.suit = suit
+  value: str
+  suit: str
 
   def __repr__(self):
     return f"{self.value} of {self.suit}"
 
-c1 = Card('A', 'Hearts')
-c2 = Card('10', 'Diamonds')
-c3 = Card('A', 'Spades')
+_SUITS = ('Hearts', 'Diamonds', 'Clubs', 'Spades')
+_VALUES = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K')
+# Cards never change after construction, so every Deck can share these
+_PROTO_DECK = tuple(Card(value, suit) for suit in _SUITS for value in _VALUES)
+
+_ALL_DEALT = "All cards have been dealt"
+_NOT_FULL = "Only full decks can be shuffled"
 
 # Each instance of Deck  should have a cards attribute with all 52 possible instances of Card .
 # Deck  should have an instance method called count  which returns a count of how many cards remain in the deck.
@@ -26,9 +31,7 @@ c3 = Card('A', 'Spades')
 
 class Deck:
   def __init__(self):
-    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-    values = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-    self.cards = [Card(value, suit) for suit in suits for value in values]
+    self.cards = list(_PROTO_DECK)
 
   def __repr__(self):
     return f"Deck of {self.count()} cards"
@@ -37,12 +40,12 @@ class Deck:
     return len(self.cards)
 
   def _deal(self, num):
-    count = self.count()
-    actual = min([count, num])
+    count = len(self.cards)
     if count == 0:
-      raise ValueError("All cards have been dealt")
+      raise ValueError(_ALL_DEALT)
+    actual = count if count < num else num
     cards = self.cards[-actual:]
-    self.cards = self.cards[:-actual]
+    del self.cards[-actual:]
     return cards
 
   def deal_card(self):
@@ -53,15 +56,20 @@ class Deck:
 
   def shuffle(self):
     if self.count() < 52:
-      raise ValueError("Only full decks can be shuffled")
+      raise ValueError(_NOT_FULL)
 
     shuffle(self.cards)
     return self
 
-d = Deck()
-d.shuffle()
-card = d.deal_card()
-print(card)
-hand = d.deal_hand(5)
-print(hand)
-# print(d.cards)
\ No newline at end of file
+if __name__ == "__main__":
+  c1 = Card('A', 'Hearts')
+  c2 = Card('10', 'Diamonds')
+  c3 = Card('A', 'Spades')
+
+  d = Deck()
+  d.shuffle()
+  card = d.deal_card()
+  print(card)
+  hand = d.deal_hand(5)
+  print(hand)
+  # print(d.cards)
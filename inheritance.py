@@ -1,8 +1,11 @@
 class Person:
+  __slots__ = ('_first', '_last', '_full_name', '_age', 'occupation')
+
   def __init__(self, first, last, age, occupation):
-    self.first = first
-    self.last = last
-    self._age = max([age, 0])
+    self._first = first
+    self._last = last
+    self._full_name = None
+    self._age = max(age, 0)
     self.occupation = occupation
 
   def __repr__(self):
@@ -12,7 +15,7 @@ class Person:
   #   return self._age
 
   # def set_age(self, new_age):
-  #   self._age = max([new_age, 0])
+  #   self._age = max(new_age, 0)
 
   @property
   def age(self):
@@ -20,20 +23,44 @@ class Person:
 
   @age.setter
   def age(self, new_age):
-    self._age = max([new_age, 0])
+    self._age = max(new_age, 0)
+
+  @property
+  def first(self):
+    return self._first
+
+  @first.setter
+  def first(self, first):
+    self._first = first
+    self._full_name = None
+
+  @property
+  def last(self):
+    return self._last
+
+  @last.setter
+  def last(self, last):
+    self._last = last
+    self._full_name = None
 
   @property
   def full_name(self):
-    return f"{self.first} {self.last}"
+    if self._full_name is None:
+      self._full_name = f"{self._first} {self._last}"
+    return self._full_name
 
   @full_name.setter
   def full_name(self, name):
-    self.first, self.last = name.split(' ')
+    self._first, self._last = name.split(' ')
+    self._full_name = name
 
 class Student(Person):
+  __slots__ = ('grade',)
+
   def __init__(self, first, last, age, grade):
-    super().__init__(first, last, age, occupation = 'Student')
+    Person.__init__(self, first, last, age, occupation = 'Student')
     self.grade = grade
 
-rafeh = Student('Rafeh', 'Siddique', 14, 'Eight')
-print(rafeh)
\ No newline at end of file
+if __name__ == "__main__":
+  rafeh = Student('Rafeh', 'Siddique', 14, 'Eight')
+  print(rafeh)
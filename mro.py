@@ -14,7 +14,7 @@ class C(A):
 class D(B, C):
   def do_something(self):
     print('Method Defined In: D')
-    super().do_something()
+    B.do_something(self)
 
 
     #       A
@@ -25,9 +25,10 @@ class D(B, C):
 
     # D, B, C, A, Object
 
-thing = D()
-thing.do_something()
+if __name__ == "__main__":
+  thing = D()
+  thing.do_something()
 
-# print(D.__mro__)
-# print(D.mro())
-# print(help(D))
\ No newline at end of file
+  # print(D.__mro__)
+  # print(D.mro())
+  # print(help(D))
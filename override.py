@@ -1,6 +1,9 @@
-class Animal():
+from abc import ABC, abstractmethod
+
+class Animal(ABC):
+  @abstractmethod
   def speak(self):
-    raise NotImplementedError('Subclass needs to implement this method')
+    ...
 
 class Dog(Animal):
   def speak(self):
@@ -13,8 +16,9 @@ class Cat(Animal):
 class Fish(Animal):
   pass
 
-d = Dog()
-print(d.speak())
+if __name__ == "__main__":
+  d = Dog()
+  print(d.speak())
 
-f = Fish()
-print(f.speak())
\ No newline at end of file
+  f = Fish()
+  print(f.speak())
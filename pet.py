@@ -1,17 +1,23 @@
+_INVALID_SPECIES = "You can't have a %s pet!"
+
 class Pet:
-  allowed = ['cat', 'dog', 'fish', 'rat']
+  __slots__ = ('name', 'species')
+  allowed = frozenset(('cat', 'dog', 'fish', 'rat'))
 
   def __init__(self, name, species):
-    if species not in Pet.allowed:
-      raise ValueError(f"You can't have a {species} pet!")
+    self.set_species(species)
     self.name = name
-    self.species = species
 
   def set_species(self, species):
-    if species not in Pet.allowed:
-      raise ValueError(f"You can't have a {species} pet!")
+    try:
+      valid = species in Pet.allowed
+    except TypeError:
+      valid = False
+    if not valid:
+      raise ValueError(_INVALID_SPECIES % (species,))
     self.species = species
 
-cat = Pet('Blue', 'cat')
-dog = Pet('Wyatt', 'dog')
-tiger = Pet('Black', 'tiger')
\ No newline at end of file
+if __name__ == "__main__":
+  cat = Pet('Blue', 'cat')
+  dog = Pet('Wyatt', 'dog')
+  tiger = Pet('Black', 'tiger')
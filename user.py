@@ -1,9 +1,11 @@
 class User:
+  __slots__ = ('_first', '_last', '_full_name', 'age', '_secret', '__msg')
   active_users = 0
 
   def __init__(self, first, last, age):
-    self.first = first
-    self.last = last
+    self._first = first
+    self._last = last
+    self._full_name = None
     self.age = age
     self._secret = 'hi'
     self.__msg = 'I like turtles!'
@@ -18,14 +20,36 @@ class User:
 
   @classmethod
   def from_string(cls, data_str):
-    first, last, age = data_str.split(',')
+    first, _, rest = data_str.partition(',')
+    last, _, age = rest.partition(',')
     return cls(first, last, int(age))
 
+  @property
+  def first(self):
+    return self._first
+
+  @first.setter
+  def first(self, first):
+    self._first = first
+    self._full_name = None
+
+  @property
+  def last(self):
+    return self._last
+
+  @last.setter
+  def last(self, last):
+    self._last = last
+    self._full_name = None
+
+  @property
   def full_name(self):
-    return f"{self.first} {self.last}"
+    if self._full_name is None:
+      self._full_name = f"{self._first} {self._last}"
+    return self._full_name
 
   def initials(self):
-    return f"{self.first[0]}.{self.last[0]}."
+    return self.first[0] + "." + self.last[0] + "."
 
   def likes(self, thing):
     return f"{self.first} likes {thing}"
@@ -42,10 +66,11 @@ class User:
     return f"{self.first} has logged out"
 
 class Moderator(User):
+  __slots__ = ('community',)
   total_mods = 0
 
   def __init__(self, first, last, age, community):
-    super().__init__(first, last, age)
+    User.__init__(self, first, last, age)
     self.community = community
     Moderator.total_mods += 1
 
@@ -54,48 +79,49 @@ class Moderator(User):
     return f"There are currently {cls.total_mods} active moderators"
 
   def remove_post(self):
-    return f"{self.full_name()} removed a post from the {self.community} community"
+    return f"{self.full_name} removed a post from the {self.community} community"
 
-u1 = User('Tom', 'Garcia', 35)
-jasmine = Moderator('Jasmine', "O'conner", 61, 'Piano')
-print(jasmine.remove_post())
-print(User.display_active_users())
-print(Moderator.display_active_users())
-print(Moderator.display_active_mods())
+if __name__ == "__main__":
+  u1 = User('Tom', 'Garcia', 35)
+  jasmine = Moderator('Jasmine', "O'conner", 61, 'Piano')
+  print(jasmine.remove_post())
+  print(User.display_active_users())
+  print(Moderator.display_active_users())
+  print(Moderator.display_active_mods())
 
 
 
 
 
 
-# u1 = User('Foyez', 'Ahmed', 27)
-# u2 = User('Manam', 'Ahmed', 23)
+  # u1 = User('Foyez', 'Ahmed', 27)
+  # u2 = User('Manam', 'Ahmed', 23)
 
-# print(u1.first, u1.last)
+  # print(u1.first, u1.last)
 
-# print(u1._secret)
-# print(u1._User__msg)
+  # print(u1._secret)
+  # print(u1._User__msg)
 
-# print(u1.full_name())
-# print(u2.full_name())
-# print(u1.initials())
+  # print(u1.full_name)
+  # print(u2.full_name)
+  # print(u1.initials())
 
-# print(u1.likes('Potato'))
+  # print(u1.likes('Potato'))
 
-# print(u1.is_senior())
-# print(u1.birthday())
+  # print(u1.is_senior())
+  # print(u1.birthday())
 
-# print(User.active_users)
-# print(u1.logout())
-# print(User.active_users)
+  # print(User.active_users)
+  # print(u1.logout())
+  # print(User.active_users)
 
-# print(User.display_active_users())
+  # print(User.display_active_users())
 
-# tom = User.from_string('Tom,Jones,89')
-# print(tom.last)
-# print(tom.full_name())
-# print(tom.birthday())
-# print(tom)
+  # tom = User.from_string('Tom,Jones,89')
+  # print(tom.last)
+  # print(tom.full_name)
+  # print(tom.birthday())
+  # print(tom)
 
-# j = User('Apple', 'Khan', 19)
-# print(j)
\ No newline at end of file
+  # j = User('Apple', 'Khan', 19)
+  # print(j)